@@ -1,8 +1,25 @@
-# Only import main module if explicitly requested
-# This prevents import errors when accessing submodules like google_auth
-try:
-    from .main import *
-except ImportError:
-    # If main.py dependencies aren't installed, skip
-    pass
-from .modules.empyrical import *
\ No newline at end of file
+import importlib
+
+from . import modules as _modules
+
+
+def __getattr__(name):
+    # Nothing heavy is imported with the package, so scripts that only need
+    # EigenLedger.modules.google_auth or email_sender start quickly. The
+    # performance metrics (sharpe_ratio, max_drawdown, ...) come from
+    # .modules and the portfolio engine (Engine, portfolio_analysis, ...)
+    # from .main, each on first access.
+    if name in _modules.__all__:
+        return getattr(_modules, name)
+    if not name.startswith('_') and name != 'main':
+        # A plain import here would re-enter this hook via hasattr(package, 'main')
+        try:
+            main = importlib.import_module('.main', __name__)
+        except ImportError as error:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} "
+                f"(EigenLedger.main could not be imported: {error})"
+            ) from error
+        if hasattr(main, name):
+            return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
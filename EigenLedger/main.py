@@ -10,7 +10,7 @@ from fpdf import FPDF
 import warnings
 import logging
 
-from .modules.empyrical import (
+from .modules import (
     cagr,
     cum_returns,
     stability_of_timeseries,
@@ -14,71 +14,96 @@
 # limitations under the License.
 # flake8: noqa
 
-from ._version import get_versions
-__version__ = get_versions()['version']
-del get_versions
+import importlib
 
-from .stats import (
-    aggregate_returns,
-    alpha,
-    alpha_aligned,
-    alpha_beta,
-    alpha_beta_aligned,
-    annual_return,
-    annual_volatility,
-    beta,
-    beta_aligned,
-    cagr,
-    beta_fragility_heuristic,
-    beta_fragility_heuristic_aligned,
-    gpd_risk_estimates,
-    gpd_risk_estimates_aligned,
-    calmar_ratio,
-    capture,
-    conditional_value_at_risk,
-    cum_returns,
-    cum_returns_final,
-    down_alpha_beta,
-    down_capture,
-    downside_risk,
-    excess_sharpe,
-    max_drawdown,
-    omega_ratio,
-    roll_alpha,
-    roll_alpha_aligned,
-    roll_alpha_beta,
-    roll_alpha_beta,
-    roll_alpha_beta_aligned,
-    roll_annual_volatility,
-    roll_beta,
-    roll_beta_aligned,
-    roll_down_capture,
-    roll_max_drawdown,
-    roll_sharpe_ratio,
-    roll_sortino_ratio,
-    roll_up_capture,
-    roll_up_down_capture,
-    sharpe_ratio,
-    simple_returns,
-    sortino_ratio,
-    stability_of_timeseries,
-    tail_ratio,
-    up_alpha_beta,
-    up_capture,
-    up_down_capture,
-    value_at_risk,
-)
+# Public names and the submodule that defines them. They are imported on
+# first access (PEP 562) so that importing an unrelated submodule such as
+# google_auth or email_sender does not load NumPy, SciPy and pandas.
+_LAZY_EXPORTS = {
+    # .stats
+    'aggregate_returns': 'stats',
+    'alpha': 'stats',
+    'alpha_aligned': 'stats',
+    'alpha_beta': 'stats',
+    'alpha_beta_aligned': 'stats',
+    'annual_return': 'stats',
+    'annual_volatility': 'stats',
+    'beta': 'stats',
+    'beta_aligned': 'stats',
+    'cagr': 'stats',
+    'beta_fragility_heuristic': 'stats',
+    'beta_fragility_heuristic_aligned': 'stats',
+    'gpd_risk_estimates': 'stats',
+    'gpd_risk_estimates_aligned': 'stats',
+    'calmar_ratio': 'stats',
+    'capture': 'stats',
+    'conditional_value_at_risk': 'stats',
+    'cum_returns': 'stats',
+    'cum_returns_final': 'stats',
+    'down_alpha_beta': 'stats',
+    'down_capture': 'stats',
+    'downside_risk': 'stats',
+    'excess_sharpe': 'stats',
+    'max_drawdown': 'stats',
+    'omega_ratio': 'stats',
+    'roll_alpha': 'stats',
+    'roll_alpha_aligned': 'stats',
+    'roll_alpha_beta': 'stats',
+    'roll_alpha_beta_aligned': 'stats',
+    'roll_annual_volatility': 'stats',
+    'roll_beta': 'stats',
+    'roll_beta_aligned': 'stats',
+    'roll_down_capture': 'stats',
+    'roll_max_drawdown': 'stats',
+    'roll_sharpe_ratio': 'stats',
+    'roll_sortino_ratio': 'stats',
+    'roll_up_capture': 'stats',
+    'roll_up_down_capture': 'stats',
+    'sharpe_ratio': 'stats',
+    'simple_returns': 'stats',
+    'sortino_ratio': 'stats',
+    'stability_of_timeseries': 'stats',
+    'tail_ratio': 'stats',
+    'up_alpha_beta': 'stats',
+    'up_capture': 'stats',
+    'up_down_capture': 'stats',
+    'value_at_risk': 'stats',
 
-from .periods import (
-    DAILY,
-    WEEKLY,
-    MONTHLY,
-    QUARTERLY,
-    YEARLY
-)
+    # .periods
+    'DAILY': 'periods',
+    'WEEKLY': 'periods',
+    'MONTHLY': 'periods',
+    'QUARTERLY': 'periods',
+    'YEARLY': 'periods',
 
+    # .perf_attrib
+    'perf_attrib': 'perf_attrib',
+    'compute_exposures': 'perf_attrib',
+}
 
-from .perf_attrib import (
-    perf_attrib,
-    compute_exposures,
-)
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name == '__version__':
+        from ._version import get_versions
+        value = get_versions()['version']
+    elif name in _LAZY_EXPORTS:
+        module_name = _LAZY_EXPORTS[name]
+        submodule = importlib.import_module(f'.{module_name}', __name__)
+        # Bind every export of the submodule now: importing it also sets the
+        # package attribute of the same name, which would otherwise leave
+        # ``perf_attrib`` pointing at the module instead of the function.
+        for export, source in _LAZY_EXPORTS.items():
+            if source == module_name:
+                globals()[export] = getattr(submodule, export)
+        return globals()[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | {'__version__'})
@@ -5,18 +5,483 @@ This module handles sending portfolio summary emails via SMTP.
 Supports HTML email templates with embedded images/charts.
 """
 
+import asyncio
+import base64
+import atexit
+import functools
+import io
 import smtplib
+import socket
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
+import math
+import mimetypes
+import numbers
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
+from email.generator import BytesGenerator
+from email.message import EmailMessage, MIMEPart
+from email.utils import formatdate, make_msgid
+from html.parser import HTMLParser
+from jinja2 import Environment
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import TracebackType
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Type
 from datetime import datetime
 
+try:
+    from PIL import Image
+except ImportError:
+    # Optional: images are attached unmodified without Pillow
+    Image = None
+
+try:
+    import pybase64
+except ImportError:
+    # Optional: SIMD base64 for attachments, stdlib otherwise
+    pybase64 = None
+
+try:
+    import aiosmtplib
+except ImportError:
+    # Optional: only needed for AsyncEmailSender
+    aiosmtplib = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Pooled connections idle for longer than this (seconds) are discarded
+# instead of reused; most SMTP servers drop idle sessions shortly after.
+POOL_IDLE_TIMEOUT = 100
+
+# Inline images wider than this are downscaled; matches the email body width
+MAX_IMAGE_WIDTH = 800
+
+# Resolved SMTP server addresses are reused for this long (seconds)
+DNS_CACHE_TTL = 15 * 60
+
+# Maximum concurrent AsyncEmailSender sessions per SMTP host
+MAX_CONCURRENT_SENDS_PER_HOST = 5
+
+
+# Portfolio email template, compiled once at import time.
+# The stylesheet only uses properties that Gmail and Outlook honour;
+# gradients, shadows, grid layout and hover effects are stripped by most
+# clients and would only add to the message size.
+_PORTFOLIO_HTML_SOURCE = """
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
+        .header { background: #667eea; color: #fff; padding: 30px; margin-bottom: 30px; }
+        .header h1 { margin: 0 0 10px 0; font-size: 28px; }
+        .header p { margin: 0; }
+        .metric-card { background: #f8f9fa; padding: 20px; margin-bottom: 20px; border-left: 4px solid #667eea; }
+        .metric-card h3 { margin: 0 0 10px 0; font-size: 14px; color: #666; text-transform: uppercase; }
+        .metric-card .value { font-size: 24px; font-weight: bold; color: #333; }
+        .metric-card .sub-value { font-size: 14px; margin-top: 5px; }
+        .note { color: #666; font-size: 13px; }
+        .positive { color: #28a745; }
+        .negative { color: #dc3545; }
+        .holdings-table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        .holdings-table th { background: #667eea; color: #fff; padding: 12px; text-align: left; }
+        .holdings-table td { padding: 12px; border-bottom: 1px solid #eee; }
+        .chart { margin: 30px 0; text-align: center; }
+        .chart img { max-width: 100%; }
+        .footer { margin-top: 40px; padding-top: 20px; border-top: 2px solid #eee; text-align: center; color: #666; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>📊 Portfolio Summary</h1>
+        <p>{{ date }}</p>
+    </div>
+    
+    <div class="metrics">
+        <div class="metric-card">
+            <h3>Total Portfolio Value</h3>
+            <div class="value">${{ total_value|money }}</div>
+        </div>
+        
+        <div class="metric-card">
+            <h3>Daily Change</h3>
+            <div class="value {{ change_color }}">${{ daily_change|money }}</div>
+            <div class="sub-value {{ change_color }}">({{ daily_pct|signed }}%)</div>
+        </div>
+        
+        <div class="metric-card">
+            <h3>Total Return</h3>
+            <div class="value">${{ total_return|money }}</div>
+            <div class="sub-value">({{ total_return_pct|signed }}%)</div>
+        </div>
+    </div>
+{% if unpriced %}
+    
+    <p class="note">No current price for {{ unpriced|join(', ') }}; not included in the total value.</p>
+{% endif %}
+{% if holdings %}
+    
+    <h2>Top Holdings</h2>
+    <table class="holdings-table">
+        <thead>
+            <tr>
+                <th>Ticker</th>
+                <th>Quantity</th>
+                <th>Value</th>
+                <th>% Change</th>
+            </tr>
+        </thead>
+        <tbody>
+        {% for holding in holdings %}
+            <tr>
+                <td><strong>{{ holding.ticker }}</strong></td>
+                <td>{{ holding.quantity|whole }}</td>
+                <td>{{ 'n/a' if holding.value is none else '$' ~ holding.value|money }}</td>
+                <td class="{{ 'positive' if holding.pct_change >= 0 else 'negative' }}">{{ holding.pct_change|signed }}%</td>
+            </tr>
+        {% endfor %}
+        </tbody>
+    </table>
+{% endif %}
+{% if include_chart %}
+    
+    <div class="chart">
+        <h2>Performance Chart</h2>
+        <img src="cid:chart" alt="Portfolio Performance Chart">
+    </div>
+{% endif %}
+    
+    <div class="footer">
+        <p>This is an automated email from your Portfolio Management System.</p>
+        <p>Generated by Bricks Portfolio Tracker</p>
+    </div>
+</body>
+</html>
+"""
+
+_template_env = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+_template_env.filters.update(
+    money=lambda value: format(value, ',.2f'),
+    signed=lambda value: format(value, '+.2f'),
+    whole=lambda value: format(value, ',.0f'),
+)
+_PORTFOLIO_TMPL = _template_env.from_string(_PORTFOLIO_HTML_SOURCE)
+
+
+def _num(value: Any, default: float = 0.0) -> float:
+    """Coerce a metric to float, substituting ``default`` for missing or non-numeric values."""
+    return float(value) if isinstance(value, numbers.Real) else default
+
+
+def _as_records(holdings: Any, limit: int) -> Iterator[Dict[str, Any]]:
+    """
+    Yield up to ``limit`` holdings as dicts.
+    
+    Accepts a list of dicts or a DataFrame; only the DataFrame rows that
+    are actually shown get converted.
+    """
+    if hasattr(holdings, 'itertuples'):
+        for row in holdings.head(limit).itertuples(index=False):
+            yield row._asdict()
+    else:
+        yield from holdings[:limit]
+
+
+def _holding_context(holding: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize one holding for the template; an unpriced (NaN) value becomes None."""
+    value = holding.get('value')
+    return {
+        'ticker': holding.get('ticker', 'N/A'),
+        'quantity': _num(holding.get('quantity')),
+        'value': None if isinstance(value, float) and math.isnan(value) else _num(value),
+        'pct_change': _num(holding.get('pct_change')),
+    }
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """
+    Single-pass HTML to plain text converter.
+    
+    Collects text nodes, turns block-level tags into line breaks and
+    skips the contents of <style>, <script> and <head>.
+    """
+    
+    _SKIP_TAGS = {'style', 'script', 'head'}
+    _BLOCK_TAGS = {'br', 'p', 'div', 'tr', 'h1', 'h2', 'h3', 'table'}
+    
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._chunks: List[str] = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'br':
+            self._chunks.append('\n')
+    
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self._BLOCK_TAGS:
+            self._chunks.append('\n')
+    
+    def handle_data(self, data: str) -> None:
+        # Whitespace in the markup is layout only; line breaks come from tags
+        text = ' '.join(data.split())
+        if text and not self._skip_depth:
+            self._chunks.append(f' {text} ')
+    
+    def get_text(self) -> str:
+        lines = (' '.join(line.split()) for line in ''.join(self._chunks).split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+
+def _html_to_text(html: str) -> str:
+    """Convert an HTML body to a plain text alternative."""
+    parser = _HTMLTextExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.get_text()
+
+
+def _optimize_image(data: bytes, max_width: int = MAX_IMAGE_WIDTH) -> bytes:
+    """
+    Shrink a PNG/JPEG image to at most ``max_width`` pixels wide.
+    
+    PNGs are always re-encoded with ``optimize=True``; JPEGs only when
+    they need resizing, to avoid a lossy round trip. The original bytes
+    are returned if Pillow is unavailable, the image cannot be decoded
+    (including oversized "decompression bomb" images), or re-encoding
+    does not make it smaller.
+    
+    Args:
+        data: Encoded image bytes
+        max_width: Maximum width in pixels
+    
+    Returns:
+        Encoded image bytes in the original format
+    """
+    if Image is None:
+        return data
+    
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            fmt = img.format
+            if fmt not in ('PNG', 'JPEG') or (fmt == 'JPEG' and img.width <= max_width):
+                return data
+            img.thumbnail((max_width, max_width * 2))
+            buf = io.BytesIO()
+            img.save(buf, fmt, optimize=True)
+    except Exception as e:
+        # Best effort only: undecodable images and Pillow's
+        # DecompressionBombError (not an OSError) fall back to the original
+        logger.debug(f"Could not optimize image, attaching as-is: {e}")
+        return data
+    
+    optimized = buf.getvalue()
+    return optimized if len(optimized) < len(data) else data
+
+
+def _b64_body(data: bytes) -> str:
+    """Base64-encode a MIME body as 76-character lines, like email.encoders."""
+    if pybase64 is None:
+        return base64.encodebytes(data).decode('ascii')
+    
+    encoded = pybase64.b64encode(data).decode('ascii')
+    return ''.join(encoded[i:i + 76] + '\n' for i in range(0, len(encoded), 76))
+
+
+def _read_images(paths: List[Path]) -> List[Optional[bytes]]:
+    """
+    Load image files through the memoized loader.
+    
+    Several images are read on a thread pool since file reads release the
+    GIL; a single image is read inline to avoid the executor overhead.
+    Missing files are logged and returned as None.
+    """
+    def load(path: Path) -> Optional[bytes]:
+        try:
+            stat = path.stat()
+            return _load_image_bytes(str(path), stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            logger.warning(f"Image not found: {path}")
+            return None
+    
+    if len(paths) <= 1:
+        return [load(path) for path in paths]
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return list(executor.map(load, paths))
+
+
+def _image_part(data: bytes, image_path: Path, cid: str) -> MIMEPart:
+    """
+    Build an inline image part referenced from the HTML as ``cid:<cid>``.
+    
+    The body is base64-encoded with _b64_body rather than through the
+    content manager, so pybase64 is used when available.
+    """
+    content_type = mimetypes.guess_type(image_path.name)[0] or 'image/png'
+    
+    part = MIMEPart(policy=policy.SMTP)
+    part['Content-Type'] = content_type
+    part['Content-Transfer-Encoding'] = 'base64'
+    part['Content-ID'] = f'<{cid}>'
+    part.add_header('Content-Disposition', 'inline', filename=image_path.name)
+    part.set_payload(_b64_body(data))
+    return part
+
+
+@functools.lru_cache(maxsize=32)
+def _load_image_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read and optimize an image file, memoized on its path, modification
+    time and size.
+    
+    The stat fields are part of the cache key only so that a chart
+    rewritten in place is re-read instead of served stale.
+    """
+    with open(path, 'rb') as f:
+        return _optimize_image(f.read())
+
+
+def _body_cte(body: str) -> str:
+    """
+    Pick a transfer encoding that keeps a text part 7-bit clean.
+    
+    Left to itself, policy.SMTP sends non-ASCII text (e.g. the report's
+    emoji) as 8bit, which the server may only receive after
+    BODY=8BITMIME has been declared.
+    """
+    return '7bit' if body.isascii() else 'quoted-printable'
+
+
+def _build_message(
+    from_email: str,
+    to_emails: List[str],
+    subject: str,
+    html_body: str,
+    text_body: Optional[str] = None,
+    images: Optional[Dict[str, Path]] = None
+) -> EmailMessage:
+    """
+    Build a multipart HTML email with a plain text alternative and inline images.
+    
+    Args:
+        from_email: Sender email address
+        to_emails: List of recipient email addresses
+        subject: Email subject line
+        html_body: HTML version of email body
+        text_body: Plain text version (optional, auto-generated if None)
+        images: Dict mapping content IDs to image file paths
+    
+    Returns:
+        Message ready to be handed to an SMTP client
+    """
+    # Create message
+    msg = EmailMessage(policy=policy.SMTP)
+    msg['From'] = from_email
+    msg['To'] = ', '.join(to_emails)
+    msg['Subject'] = subject
+    msg['Date'] = formatdate(localtime=True)
+    msg['Message-ID'] = make_msgid(domain=from_email.rpartition('@')[2] or None)
+    
+    # Add plain text version
+    if text_body is None:
+        text_body = _html_to_text(html_body)
+    
+    msg.set_content(text_body, cte=_body_cte(text_body))
+    
+    # Add HTML version as the preferred alternative
+    msg.add_alternative(html_body, subtype='html', cte=_body_cte(html_body))
+    
+    # Attach images if provided; they go in a multipart/related together
+    # with the HTML part that references them
+    if images:
+        loaded = [
+            (cid, image_path, data)
+            for (cid, image_path), data in zip(images.items(), _read_images(list(images.values())))
+            if data is not None
+        ]
+        if loaded:
+            html_part = msg.get_body(('html',))
+            html_part.make_related()
+            for cid, image_path, data in loaded:
+                html_part.attach(_image_part(data, image_path, cid))
+                logger.debug(f"Attached image: {cid} -> {image_path}")
+    
+    return msg
+
+
+# (host, port) -> (addresses, expiry as time.monotonic())
+_dns_cache: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+_dns_lock = threading.Lock()
+
+
+def _resolve(host: str, port: int) -> List[str]:
+    """
+    Resolve an SMTP host to its addresses, cached for ``DNS_CACHE_TTL``.
+    
+    Returns:
+        Unique addresses in resolver order
+    """
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get((host, port))
+    if entry is not None and entry[1] > now:
+        return entry[0]
+    
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    with _dns_lock:
+        _dns_cache[(host, port)] = (addresses, now + DNS_CACHE_TTL)
+    return addresses
+
+
+def _prefer_resolved(host: str, port: int, address: str) -> None:
+    """Move an address that accepted a connection to the front of the cache."""
+    with _dns_lock:
+        entry = _dns_cache.get((host, port))
+        if entry is not None and address in entry[0]:
+            addresses = [address] + [a for a in entry[0] if a != address]
+            _dns_cache[(host, port)] = (addresses, entry[1])
+
+
+def _forget_resolved(host: str, port: int) -> None:
+    """Drop a cached resolution, e.g. after every address failed."""
+    with _dns_lock:
+        _dns_cache.pop((host, port), None)
+
+
+class _DotStuffingWriter:
+    """
+    Binary file wrapper applying SMTP DATA transparency (RFC 5321 4.5.2).
+    
+    Doubles any '.' at the start of a line as the message is written, so
+    a generator can flatten a message straight onto the SMTP socket.
+    """
+    
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        # Pretend the stream starts after a line break so a leading '.' is stuffed
+        self._tail = b'\r\n'
+    
+    def write(self, data: bytes) -> int:
+        if data:
+            self._raw.write((self._tail[-1:] + data).replace(b'\n.', b'\n..')[1:])
+            self._tail = (self._tail + data)[-2:]
+        return len(data)
+    
+    def finish(self) -> None:
+        """Write the end-of-data marker and flush to the server."""
+        if self._tail != b'\r\n':
+            self._raw.write(b'\r\n')
+        self._raw.write(b'.\r\n')
+        self._raw.flush()
+
 
 class EmailSender:
     """
@@ -27,15 +492,27 @@ class EmailSender:
     - Embedded images (inline attachments)
     - Multiple recipients
     - TLS encryption
+    - Persistent, pooled SMTP connections
+    
+    The SMTP session (connect + TLS + login) is reused across messages.
+    Use the sender as a context manager to keep a dedicated connection
+    open for a batch of sends; outside a ``with`` block the connection is
+    parked in a class-level pool keyed by ``(server, port, user)`` so later
+    sends to the same account skip the handshake as well.
     """
     
+    # (server, port, user) -> (connection, last_used timestamp, messages sent)
+    _pool: Dict[Tuple[str, int, str], Tuple[smtplib.SMTP, float, int]] = {}
+    _pool_lock = threading.Lock()
+    
     def __init__(
         self,
         smtp_server: str,
         smtp_port: int,
         from_email: str,
         password: str,
-        use_tls: bool = True
+        use_tls: bool = True,
+        max_messages_per_connection: int = 100
     ):
         """
         Initialize the email sender.
@@ -46,12 +523,162 @@ class EmailSender:
             from_email: Sender email address
             password: Email account password or app-specific password
             use_tls: Whether to use TLS encryption (default: True)
+            max_messages_per_connection: Recycle the SMTP connection after
+                this many messages (default: 100)
         """
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.from_email = from_email
         self.password = password
         self.use_tls = use_tls
+        self.max_messages_per_connection = max_messages_per_connection
+        
+        self._server: Optional[smtplib.SMTP] = None
+        self._messages_sent = 0
+        self._in_context = False
+    
+    def __enter__(self) -> "EmailSender":
+        self._ensure_connected()
+        # Only once connected: a failed connect must not leave later
+        # send_email calls thinking they run inside a with block
+        self._in_context = True
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        self._in_context = False
+        self.close()
+    
+    @property
+    def _pool_key(self) -> Tuple[str, int, str]:
+        return (self.smtp_server, self.smtp_port, self.from_email)
+    
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open and authenticate a new SMTP connection.
+        
+        Returns:
+            Logged-in SMTP connection, also stored on the instance
+        """
+        logger.info(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}")
+        
+        # STARTTLS upgrades a plain connection; otherwise use implicit SSL
+        server = smtplib.SMTP() if self.use_tls else smtplib.SMTP_SSL()
+        # Connect by (cached) IP address but keep the hostname for TLS SNI
+        # and certificate verification
+        server._host = self.smtp_server
+        
+        addresses = _resolve(self.smtp_server, self.smtp_port)
+        for i, address in enumerate(addresses):
+            try:
+                server.connect(address, self.smtp_port)
+                if i:
+                    _prefer_resolved(self.smtp_server, self.smtp_port, address)
+                break
+            except OSError:
+                if i == len(addresses) - 1:
+                    # Addresses may have moved; resolve afresh next time
+                    _forget_resolved(self.smtp_server, self.smtp_port)
+                    raise
+        
+        if self.use_tls:
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+        
+        server.login(self.from_email, self.password)
+        
+        self._server = server
+        self._messages_sent = 0
+        return server
+    
+    def _acquire_pooled(self) -> Optional[smtplib.SMTP]:
+        """
+        Take a non-expired connection for this account out of the pool.
+        
+        The number of messages already sent on it is restored, so
+        ``max_messages_per_connection`` also applies across senders.
+        """
+        with self._pool_lock:
+            entry = self._pool.pop(self._pool_key, None)
+        if entry is None:
+            return None
+        
+        server, last_used, messages_sent = entry
+        if time.monotonic() - last_used > POOL_IDLE_TIMEOUT:
+            logger.debug("Discarding idle pooled SMTP connection")
+            _quit_quietly(server)
+            return None
+        
+        self._server = server
+        self._messages_sent = messages_sent
+        return server
+    
+    def _release(self) -> None:
+        """Park the instance's connection in the pool for later reuse."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        
+        with self._pool_lock:
+            previous = self._pool.get(self._pool_key)
+            self._pool[self._pool_key] = (server, time.monotonic(), self._messages_sent)
+        if previous is not None and previous[0] is not server:
+            _quit_quietly(previous[0])
+    
+    def _ensure_connected(self) -> smtplib.SMTP:
+        """
+        Return a live SMTP connection, reusing an existing one if possible.
+        
+        The connection is recycled once ``max_messages_per_connection``
+        messages have been sent on it, and re-established if the server
+        has dropped it.
+        
+        Returns:
+            Logged-in SMTP connection
+        """
+        if self._server is None:
+            self._acquire_pooled()
+        
+        if self._server is not None and self._messages_sent >= self.max_messages_per_connection:
+            logger.debug("Recycling SMTP connection after "
+                         f"{self._messages_sent} messages")
+            self.close()
+        
+        if self._server is None:
+            return self._connect()
+        
+        try:
+            self._server.noop()
+        except (smtplib.SMTPServerDisconnected, OSError):
+            logger.info("SMTP connection was closed by the server, reconnecting")
+            self._discard()
+            return self._connect()
+        
+        return self._server
+    
+    def _discard(self) -> None:
+        """Drop the instance's connection without returning it to the pool."""
+        server, self._server = self._server, None
+        if server is not None:
+            _quit_quietly(server)
+    
+    def close(self) -> None:
+        """Close the SMTP connection held by this sender, if any."""
+        self._discard()
+    
+    @classmethod
+    def close_pool(cls) -> None:
+        """Close every pooled SMTP connection."""
+        with cls._pool_lock:
+            entries = list(cls._pool.values())
+            cls._pool.clear()
+        for server, _, _ in entries:
+            _quit_quietly(server)
         
     def send_email(
         self,
@@ -76,76 +703,102 @@ class EmailSender:
             True if email sent successfully, False otherwise
         """
         try:
-            # Create message
-            msg = MIMEMultipart('related')
-            msg['From'] = self.from_email
-            msg['To'] = ', '.join(to_emails)
-            msg['Subject'] = subject
-            msg['Date'] = datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')
-            
-            # Create alternative part for HTML and text
-            msg_alternative = MIMEMultipart('alternative')
-            msg.attach(msg_alternative)
-            
-            # Add plain text version
-            if text_body is None:
-                # Simple HTML to text conversion
-                text_body = html_body.replace('<br>', '\n').replace('</p>', '\n\n')
-                # Remove all HTML tags
-                import re
-                text_body = re.sub('<[^<]+?>', '', text_body)
-            
-            msg_text = MIMEText(text_body, 'plain')
-            msg_alternative.attach(msg_text)
-            
-            # Add HTML version
-            msg_html = MIMEText(html_body, 'html')
-            msg_alternative.attach(msg_html)
-            
-            # Attach images if provided
-            if images:
-                for cid, image_path in images.items():
-                    if image_path.exists():
-                        with open(image_path, 'rb') as f:
-                            img = MIMEImage(f.read())
-                            img.add_header('Content-ID', f'<{cid}>')
-                            img.add_header('Content-Disposition', 'inline', filename=image_path.name)
-                            msg.attach(img)
-                            logger.debug(f"Attached image: {cid} -> {image_path}")
-                    else:
-                        logger.warning(f"Image not found: {image_path}")
-            
-            # Send email
-            logger.info(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}")
-            
-            if self.use_tls:
-                # Use STARTTLS
-                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # Use SSL
-                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+            msg = _build_message(self.from_email, to_emails, subject, html_body, text_body, images)
             
-            server.login(self.from_email, self.password)
+            # Send email, reconnecting once if the server dropped the session
+            server = self._ensure_connected()
             logger.info(f"Sending email to: {', '.join(to_emails)}")
-            server.send_message(msg)
-            server.quit()
+            try:
+                self._send_streaming(server, msg, to_emails)
+            except smtplib.SMTPServerDisconnected:
+                logger.info("SMTP connection lost while sending, retrying once")
+                self._discard()
+                self._send_streaming(self._connect(), msg, to_emails)
+            self._messages_sent += 1
+            
+            if not self._in_context:
+                self._release()
             
             logger.info(f"Email sent successfully to {len(to_emails)} recipient(s)")
             return True
             
         except smtplib.SMTPAuthenticationError as e:
             logger.error(f"SMTP authentication failed: {e}")
+            self._discard()
             return False
         except smtplib.SMTPException as e:
             logger.error(f"SMTP error occurred: {e}")
+            self._discard()
             return False
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
+            self._discard()
             return False
     
+    def _send_streaming(
+        self,
+        server: smtplib.SMTP,
+        msg: EmailMessage,
+        to_emails: List[str]
+    ) -> None:
+        """
+        Send a message, flattening it directly onto the SMTP socket.
+        
+        Equivalent to ``server.send_message(msg)`` without the copies it
+        makes after flattening (the joined bytes, the dot-stuffed copy and
+        the CRLF-normalized copy): generator output goes to the socket as
+        it is produced. This does not lower peak memory, which is set by
+        ``email.generator`` buffering each MIME part before writing it
+        (about three times the encoded size of the largest attachment on
+        either path).
+        
+        Raises:
+            SMTPSenderRefused: If the server rejects the sender
+            SMTPRecipientsRefused: If every recipient is rejected
+            SMTPDataError: If the server rejects the message data
+        """
+        gen_policy = msg.policy.clone(linesep='\r\n')
+        mail_options = ()
+        if not all(addr.isascii() for addr in (self.from_email, *to_emails)):
+            if not server.has_extn('smtputf8'):
+                raise smtplib.SMTPNotSupportedError(
+                    "One or more source or delivery addresses require"
+                    " internationalized email support, but the server"
+                    " does not advertise the required SMTPUTF8 capability")
+            gen_policy = gen_policy.clone(utf8=True)
+            mail_options = ('SMTPUTF8', 'BODY=8BITMIME')
+        
+        server.ehlo_or_helo_if_needed()
+        code, resp = server.mail(self.from_email, mail_options)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, self.from_email)
+        
+        refused = {}
+        for addr in to_emails:
+            code, resp = server.rcpt(addr)
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+        if len(refused) == len(to_emails):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        for addr, (code, resp) in refused.items():
+            logger.warning(f"Recipient refused: {addr} ({code} {resp!r})")
+        
+        code, resp = server.docmd('DATA')
+        if code != 354:
+            server.rset()
+            raise smtplib.SMTPDataError(code, resp)
+        
+        with server.sock.makefile('wb') as sock_file:
+            writer = _DotStuffingWriter(sock_file)
+            BytesGenerator(writer, policy=gen_policy).flatten(msg)
+            writer.finish()
+        
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+    
     def send_portfolio_summary(
         self,
         to_emails: List[str],
@@ -157,28 +810,30 @@ class EmailSender:
         
         Args:
             to_emails: List of recipient email addresses
-            portfolio_data: Dictionary containing portfolio metrics
+            portfolio_data: Dictionary containing portfolio metrics; its
+                'holdings' entry may be a list of dicts or a DataFrame
             chart_path: Optional path to performance chart image
         
         Returns:
             True if email sent successfully, False otherwise
         """
-        subject = f"Daily Portfolio Summary - {datetime.now().strftime('%B %d, %Y')}"
+        # One timestamp for subject and body so they agree across midnight
+        now = datetime.now()
+        subject = f"Daily Portfolio Summary - {now:%B %d, %Y}"
         
         # Generate HTML body
-        html_body = self._generate_portfolio_html(portfolio_data, chart_path is not None)
+        html_body = self._generate_portfolio_html(portfolio_data, chart_path is not None, now=now)
         
         # Attach chart if provided
-        images = {}
-        if chart_path and chart_path.exists():
-            images['chart'] = chart_path
+        images = {'chart': chart_path} if chart_path else {}
         
         return self.send_email(to_emails, subject, html_body, images=images)
     
     def _generate_portfolio_html(
         self,
         data: Dict[str, Any],
-        include_chart: bool = False
+        include_chart: bool = False,
+        now: Optional[datetime] = None
     ) -> str:
         """
         Generate HTML email body for portfolio summary.
@@ -186,210 +841,172 @@ class EmailSender:
         Args:
             data: Portfolio metrics dictionary
             include_chart: Whether to include chart image placeholder
+            now: Report timestamp (default: current time)
         
         Returns:
             HTML string
         """
         # Extract data with defaults
-        date = datetime.now().strftime('%B %d, %Y')
-        total_value = data.get('total_value', 'N/A')
-        daily_change = data.get('daily_change', 'N/A')
-        daily_pct = data.get('daily_change_pct', 'N/A')
-        total_return = data.get('total_return', 'N/A')
-        total_return_pct = data.get('total_return_pct', 'N/A')
+        date = f"{now or datetime.now():%B %d, %Y}"
+        total_value = _num(data.get('total_value'))
+        daily_change = _num(data.get('daily_change'))
+        daily_pct = _num(data.get('daily_change_pct'))
+        total_return = _num(data.get('total_return'))
+        total_return_pct = _num(data.get('total_return_pct'))
         
-        holdings = data.get('holdings', [])
+        holdings = data.get('holdings')
+        if holdings is None:
+            holdings = []
+        unpriced = data.get('unpriced') or []
         
         # Determine color for daily change
-        change_color = 'green' if isinstance(daily_change, (int, float)) and daily_change >= 0 else 'red'
-        
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }}
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    margin-bottom: 30px;
-                }}
-                .header h1 {{
-                    margin: 0 0 10px 0;
-                    font-size: 28px;
-                }}
-                .header p {{
-                    margin: 0;
-                    opacity: 0.9;
-                }}
-                .metrics {{
-                    display: grid;
-                    grid-template-columns: repeat(2, 1fr);
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }}
-                .metric-card {{
-                    background: #f8f9fa;
-                    padding: 20px;
-                    border-radius: 8px;
-                    border-left: 4px solid #667eea;
-                }}
-                .metric-card h3 {{
-                    margin: 0 0 10px 0;
-                    font-size: 14px;
-                    color: #666;
-                    text-transform: uppercase;
-                }}
-                .metric-card .value {{
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #333;
-                }}
-                .metric-card .sub-value {{
-                    font-size: 14px;
-                    margin-top: 5px;
-                }}
-                .positive {{
-                    color: #28a745;
-                }}
-                .negative {{
-                    color: #dc3545;
-                }}
-                .holdings-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                    background: white;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    border-radius: 8px;
-                    overflow: hidden;
-                }}
-                .holdings-table th {{
-                    background: #667eea;
-                    color: white;
-                    padding: 12px;
-                    text-align: left;
-                    font-weight: 600;
-                }}
-                .holdings-table td {{
-                    padding: 12px;
-                    border-bottom: 1px solid #eee;
-                }}
-                .holdings-table tr:last-child td {{
-                    border-bottom: none;
-                }}
-                .holdings-table tr:hover {{
-                    background: #f8f9fa;
-                }}
-                .chart {{
-                    margin: 30px 0;
-                    text-align: center;
-                }}
-                .chart img {{
-                    max-width: 100%;
-                    border-radius: 8px;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                }}
-                .footer {{
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 2px solid #eee;
-                    text-align: center;
-                    color: #666;
-                    font-size: 12px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>📊 Portfolio Summary</h1>
-                <p>{date}</p>
-            </div>
-            
-            <div class="metrics">
-                <div class="metric-card">
-                    <h3>Total Portfolio Value</h3>
-                    <div class="value">${total_value:,.2f}</div>
-                </div>
-                
-                <div class="metric-card">
-                    <h3>Daily Change</h3>
-                    <div class="value {change_color}">${daily_change:,.2f}</div>
-                    <div class="sub-value {change_color}">({daily_pct:+.2f}%)</div>
-                </div>
-                
-                <div class="metric-card">
-                    <h3>Total Return</h3>
-                    <div class="value">${total_return:,.2f}</div>
-                    <div class="sub-value">({total_return_pct:+.2f}%)</div>
-                </div>
-            </div>
+        change_color = 'green' if daily_change >= 0 else 'red'
+        
+        return _PORTFOLIO_TMPL.render(
+            date=date,
+            total_value=total_value,
+            daily_change=daily_change,
+            daily_pct=daily_pct,
+            total_return=total_return,
+            total_return_pct=total_return_pct,
+            change_color=change_color,
+            holdings=[_holding_context(holding) for holding in _as_records(holdings, 10)],  # Top 10 holdings
+            unpriced=unpriced,
+            include_chart=include_chart,
+        )
+
+
+# (server, port) -> semaphore capping concurrent sends to that host
+_HostSemaphores = Dict[Tuple[str, int], asyncio.Semaphore]
+
+
+class AsyncEmailSender:
+    """
+    Asynchronous email sender built on ``aiosmtplib``.
+    
+    Useful when fanning out to several SMTP servers or sending many
+    messages concurrently: network I/O for all sends overlaps on a single
+    event loop. Concurrent sessions against the same host are capped at
+    ``MAX_CONCURRENT_SENDS_PER_HOST``.
+    
+    Example:
+        results = await asyncio.gather(*[
+            sender.send_email(to_emails, subject, html_body)
+            for sender in per_host_senders
+        ])
+    """
+    
+    # event loop -> {(server, port): semaphore}; semaphores are loop-bound
+    _semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _HostSemaphores]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    def __init__(
+        self,
+        smtp_server: str,
+        smtp_port: int,
+        from_email: str,
+        password: str,
+        use_tls: bool = True
+    ):
         """
+        Initialize the async email sender.
         
-        # Add holdings table if available
-        if holdings:
-            html += """
-            <h2>Top Holdings</h2>
-            <table class="holdings-table">
-                <thead>
-                    <tr>
-                        <th>Ticker</th>
-                        <th>Quantity</th>
-                        <th>Value</th>
-                        <th>% Change</th>
-                    </tr>
-                </thead>
-                <tbody>
-            """
-            
-            for holding in holdings[:10]:  # Top 10 holdings
-                ticker = holding.get('ticker', 'N/A')
-                qty = holding.get('quantity', 0)
-                value = holding.get('value', 0)
-                pct_change = holding.get('pct_change', 0)
-                change_class = 'positive' if pct_change >= 0 else 'negative'
-                
-                html += f"""
-                    <tr>
-                        <td><strong>{ticker}</strong></td>
-                        <td>{qty:,.0f}</td>
-                        <td>${value:,.2f}</td>
-                        <td class="{change_class}">{pct_change:+.2f}%</td>
-                    </tr>
-                """
-            
-            html += """
-                </tbody>
-            </table>
-            """
-        
-        # Add chart if available
-        if include_chart:
-            html += """
-            <div class="chart">
-                <h2>Performance Chart</h2>
-                <img src="cid:chart" alt="Portfolio Performance Chart">
-            </div>
-            """
-        
-        html += """
-            <div class="footer">
-                <p>This is an automated email from your Portfolio Management System.</p>
-                <p>Generated by Bricks Portfolio Tracker</p>
-            </div>
-        </body>
-        </html>
+        Args:
+            smtp_server: SMTP server hostname (e.g., 'smtp.gmail.com')
+            smtp_port: SMTP server port (e.g., 587 for TLS, 465 for SSL)
+            from_email: Sender email address
+            password: Email account password or app-specific password
+            use_tls: Whether to use STARTTLS (default: True); SSL otherwise
+        
+        Raises:
+            ImportError: If aiosmtplib is not installed
         """
+        if aiosmtplib is None:
+            raise ImportError(
+                "AsyncEmailSender requires aiosmtplib. "
+                "Install it with: poetry add aiosmtplib"
+            )
         
-        return html
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.from_email = from_email
+        self.password = password
+        self.use_tls = use_tls
+    
+    def _host_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        key = (self.smtp_server, self.smtp_port)
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(MAX_CONCURRENT_SENDS_PER_HOST)
+        return semaphores[key]
+    
+    async def send_email(
+        self,
+        to_emails: List[str],
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+        images: Optional[Dict[str, Path]] = None
+    ) -> bool:
+        """
+        Send an email with optional HTML formatting and embedded images.
+        
+        Args:
+            to_emails: List of recipient email addresses
+            subject: Email subject line
+            html_body: HTML version of email body
+            text_body: Plain text version (optional, auto-generated if None)
+            images: Dict mapping content IDs to image file paths
+        
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        try:
+            # Image reads and re-encoding block; compose off the event loop so
+            # other sends keep making progress meanwhile
+            msg = await asyncio.get_running_loop().run_in_executor(
+                None, _build_message,
+                self.from_email, to_emails, subject, html_body, text_body, images
+            )
+            
+            async with self._host_semaphore():
+                logger.info(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}")
+                smtp = aiosmtplib.SMTP(
+                    hostname=self.smtp_server,
+                    port=self.smtp_port,
+                    use_tls=not self.use_tls,
+                    start_tls=self.use_tls
+                )
+                async with smtp:
+                    await smtp.login(self.from_email, self.password)
+                    logger.info(f"Sending email to: {', '.join(to_emails)}")
+                    await smtp.send_message(msg)
+            
+            logger.info(f"Email sent successfully to {len(to_emails)} recipient(s)")
+            return True
+            
+        except aiosmtplib.SMTPAuthenticationError as e:
+            logger.error(f"SMTP authentication failed: {e}")
+            return False
+        except aiosmtplib.SMTPException as e:
+            logger.error(f"SMTP error occurred: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to send email: {e}")
+            return False
+
+
+def _quit_quietly(server: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors from an already-dead socket."""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+atexit.register(EmailSender.close_pool)
 
 
 # Convenience function
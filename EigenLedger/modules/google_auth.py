@@ -6,25 +6,30 @@ and provides functions to read data from Google Sheets.
 """
 
 import os
+import json
 import pickle
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 import logging
 
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# If modifying these scopes, delete the file token.pickle
+# If modifying these scopes, delete the file token.json
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 
 # Default paths for credentials and token
 DEFAULT_CREDENTIALS_PATH = Path('config/credentials.json')
-DEFAULT_TOKEN_PATH = Path('config/token.pickle')
+DEFAULT_TOKEN_PATH = Path('config/token.json')
 
 
 class GoogleSheetsClient:
@@ -46,7 +51,7 @@ class GoogleSheetsClient:
         
         Args:
             credentials_path: Path to OAuth credentials JSON file
-            token_path: Path to save/load OAuth token pickle file
+            token_path: Path to save/load OAuth token JSON file
             scopes: List of OAuth scopes to request
         """
         self.credentials_path = credentials_path or DEFAULT_CREDENTIALS_PATH
@@ -68,13 +73,8 @@ class GoogleSheetsClient:
             FileNotFoundError: If credentials file doesn't exist
             Exception: If authentication fails
         """
-        creds = None
-        
         # Check for existing credentials
-        if self.token_path.exists():
-            logger.info(f"Loading existing credentials from {self.token_path}")
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+        creds = self._load_credentials()
         
         # Validate and refresh credentials
         if not creds or not creds.valid:
@@ -102,20 +102,66 @@ class GoogleSheetsClient:
                 creds = flow.run_local_server(port=0)
                 
                 # Save credentials for future use
-                logger.info(f"Saving credentials to {self.token_path}")
-                self.token_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(self.token_path, 'wb') as token:
-                    pickle.dump(creds, token)
+                self._save_credentials(creds)
         
-        # Build the service
-        self.service = build('sheets', 'v4', credentials=creds)
+        # Build the service from the discovery document bundled with
+        # googleapiclient rather than fetching it over HTTP
+        self.service = build(
+            'sheets', 'v4',
+            credentials=creds,
+            static_discovery=True,
+            cache_discovery=False
+        )
         logger.info("Successfully authenticated with Google Sheets API")
     
+    def _load_credentials(self) -> Optional[Credentials]:
+        """
+        Load saved OAuth credentials from the token file.
+        
+        Tokens are stored as JSON. A legacy pickle token, either at
+        ``token_path`` itself or next to it with a ``.pickle`` suffix,
+        is loaded once and rewritten as JSON.
+        
+        Returns:
+            Saved credentials, or None if no usable token file exists
+        """
+        if self.token_path.exists():
+            logger.info(f"Loading existing credentials from {self.token_path}")
+            try:
+                info = json.loads(self.token_path.read_text(encoding='utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                # Not JSON at all: a pickle token saved under the new name
+                legacy_path = self.token_path
+            else:
+                try:
+                    return Credentials.from_authorized_user_info(info, self.scopes)
+                except ValueError as e:
+                    # e.g. no refresh_token; fall through to the OAuth flow
+                    logger.warning(f"Ignoring invalid token file {self.token_path}: {e}")
+                    return None
+        else:
+            legacy_path = self.token_path.with_suffix('.pickle')
+            if legacy_path == self.token_path or not legacy_path.exists():
+                return None
+        
+        logger.info(f"Migrating legacy pickle token {legacy_path} to JSON")
+        with open(legacy_path, 'rb') as token:
+            creds = pickle.load(token)
+        self._save_credentials(creds)
+        return creds
+    
+    def _save_credentials(self, creds: Credentials) -> None:
+        """Write OAuth credentials to the token file as JSON."""
+        logger.info(f"Saving credentials to {self.token_path}")
+        self.token_path.parent.mkdir(parents=True, exist_ok=True)
+        self.token_path.write_text(creds.to_json())
+    
     def read_sheet(
         self,
         sheet_id: str,
         range_name: str,
-        value_render_option: str = 'FORMATTED_VALUE'
+        value_render_option: str = 'FORMATTED_VALUE',
+        date_time_render_option: str = 'FORMATTED_STRING'
     ) -> List[List[Any]]:
         """
         Read data from a Google Sheet.
@@ -127,11 +173,46 @@ class GoogleSheetsClient:
                 - FORMATTED_VALUE (default): Values will be calculated and formatted
                 - UNFORMATTED_VALUE: Values will be calculated but not formatted
                 - FORMULA: Formulas will be returned
+            date_time_render_option: How dates should be rendered when
+                value_render_option is not FORMATTED_VALUE
+                - FORMATTED_STRING (default): Dates as formatted strings
+                - SERIAL_NUMBER: Dates as spreadsheet serial numbers
         
         Returns:
             List of rows, where each row is a list of cell values
             Returns empty list if no data found
         
+        Raises:
+            HttpError: If the API request fails
+            ValueError: If not authenticated
+        """
+        return self.read_sheets(
+            sheet_id, [range_name], value_render_option, date_time_render_option
+        )[0]
+    
+    def read_sheets(
+        self,
+        sheet_id: str,
+        ranges: List[str],
+        value_render_option: str = 'FORMATTED_VALUE',
+        date_time_render_option: str = 'FORMATTED_STRING',
+        major_dimension: str = 'ROWS'
+    ) -> List[List[List[Any]]]:
+        """
+        Read several ranges from a Google Sheet in a single API request.
+        
+        Args:
+            sheet_id: The Google Sheet ID (from the URL)
+            ranges: A1 notation ranges to read
+            value_render_option: How values should be rendered in the output
+                (see read_sheet)
+            date_time_render_option: How dates should be rendered in the
+                output (see read_sheet)
+            major_dimension: ROWS (default) or COLUMNS
+        
+        Returns:
+            One list of rows (or columns) per requested range, in request order
+        
         Raises:
             HttpError: If the API request fails
             ValueError: If not authenticated
@@ -140,21 +221,118 @@ class GoogleSheetsClient:
             raise ValueError("Not authenticated. Call authenticate() first.")
         
         try:
-            logger.info(f"Reading sheet {sheet_id}, range: {range_name}")
-            result = self.service.spreadsheets().values().get(
+            logger.info(f"Reading sheet {sheet_id}, ranges: {', '.join(ranges)}")
+            result = self.service.spreadsheets().values().batchGet(
                 spreadsheetId=sheet_id,
-                range=range_name,
-                valueRenderOption=value_render_option
+                ranges=ranges,
+                valueRenderOption=value_render_option,
+                dateTimeRenderOption=date_time_render_option,
+                majorDimension=major_dimension
             ).execute()
             
-            values = result.get('values', [])
-            logger.info(f"Retrieved {len(values)} rows from sheet")
+            values = [vr.get('values', []) for vr in result.get('valueRanges', [])]
+            logger.info(
+                f"Retrieved {sum(len(v) for v in values)} "
+                f"{major_dimension.lower()} from sheet"
+            )
             return values
             
         except HttpError as error:
             logger.error(f"Failed to read sheet: {error}")
             raise
     
+    def read_sheet_df(
+        self,
+        sheet_id: str,
+        range_name: str,
+        dtypes: Optional[Dict[str, Any]] = None,
+        value_render_option: str = 'UNFORMATTED_VALUE',
+        date_time_render_option: str = 'FORMATTED_STRING'
+    ) -> "pd.DataFrame":
+        """
+        Read a Google Sheet range into a DataFrame.
+        
+        Args:
+            sheet_id: The Google Sheet ID (from the URL)
+            range_name: The A1 notation range to read; its first row is the header
+            dtypes: Optional mapping of column header to dtype (see read_sheets_df)
+            value_render_option: How values should be rendered (see read_sheet)
+            date_time_render_option: How dates should be rendered (see read_sheet)
+        
+        Returns:
+            DataFrame with one column per header cell
+        
+        Raises:
+            HttpError: If the API request fails
+            ValueError: If not authenticated
+        """
+        return self.read_sheets_df(
+            sheet_id, [range_name], dtypes, value_render_option, date_time_render_option
+        )[0]
+    
+    def read_sheets_df(
+        self,
+        sheet_id: str,
+        ranges: List[str],
+        dtypes: Optional[Dict[str, Any]] = None,
+        value_render_option: str = 'UNFORMATTED_VALUE',
+        date_time_render_option: str = 'FORMATTED_STRING'
+    ) -> List["pd.DataFrame"]:
+        """
+        Read several ranges into DataFrames in a single API request.
+        
+        The ranges are requested column by column (majorDimension=COLUMNS),
+        so each list the API returns already holds one DataFrame column and
+        no row-to-column transpose is needed. The first cell of each column
+        is its header.
+        
+        Args:
+            sheet_id: The Google Sheet ID (from the URL)
+            ranges: A1 notation ranges to read
+            dtypes: Optional mapping of column header to dtype; cells that do
+                not parse as a numeric dtype become NaN
+            value_render_option: How values should be rendered (see read_sheet)
+            date_time_render_option: How dates should be rendered (see read_sheet)
+        
+        Returns:
+            One DataFrame per requested range, in request order (a DataFrame
+            without columns for an empty range)
+        
+        Raises:
+            HttpError: If the API request fails
+            ValueError: If not authenticated
+        """
+        # pandas is only needed by the DataFrame helpers
+        import pandas as pd
+        
+        dtypes = dtypes or {}
+        frames = []
+        for columns in self.read_sheets(
+            sheet_id, ranges, value_render_option, date_time_render_option,
+            major_dimension='COLUMNS'
+        ):
+            # The API trims trailing empty cells, so columns can be ragged
+            length = max((len(column) for column in columns), default=1) - 1
+            data = {}
+            for column in columns:
+                if not column:
+                    continue
+                header, values = column[0], column[1:]
+                series = pd.Series(values + [None] * (length - len(values)), dtype=object)
+                # Blank cells (and blank spacer rows) come back as '' in
+                # column-major responses; treat them as missing
+                series = series.mask(series.eq(''))
+                dtype = dtypes.get(header)
+                if dtype is not None:
+                    if pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype)):
+                        series = pd.to_numeric(series, errors='coerce').astype(dtype)
+                    else:
+                        series = series.astype(dtype)
+                data[header] = series
+            frames.append(pd.DataFrame(data))
+        
+        return frames
+    
     def get_sheet_metadata(self, sheet_id: str) -> dict:
         """
         Get metadata about a Google Sheet.
@@ -185,20 +363,55 @@ class GoogleSheetsClient:
             raise
 
 
+# Authenticated clients handed out by get_client(), keyed by
+# (credentials_path, token_path, scopes)
+_client_cache: Dict[Tuple[Path, Path, Tuple[str, ...]], GoogleSheetsClient] = {}
+
+
+def get_client(
+    credentials_path: Optional[Path] = None,
+    token_path: Optional[Path] = None,
+    scopes: Optional[List[str]] = None
+) -> GoogleSheetsClient:
+    """
+    Return an authenticated client, reusing one from earlier calls.
+    
+    Loading the token, refreshing it and building the API service only
+    happens on the first call for a given set of paths and scopes.
+    
+    Args:
+        credentials_path: Path to OAuth credentials JSON file
+        token_path: Path to save/load OAuth token file
+        scopes: List of OAuth scopes to request
+    
+    Returns:
+        Authenticated GoogleSheetsClient
+    """
+    key = (
+        Path(credentials_path or DEFAULT_CREDENTIALS_PATH),
+        Path(token_path or DEFAULT_TOKEN_PATH),
+        tuple(scopes or SCOPES),
+    )
+    client = _client_cache.get(key)
+    if client is None:
+        client = _client_cache.setdefault(key, GoogleSheetsClient(*key[:2], list(key[2])))
+    if client.service is None:
+        client.authenticate()
+    return client
+
+
 # Convenience functions for simple usage
-def get_google_sheets_service():
+def get_google_sheets_service() -> Any:
     """
     Get an authenticated Google Sheets API service.
     
-    This is a convenience function that creates a client,
-    authenticates it, and returns the service object.
+    This is a convenience function that returns the service object of a
+    cached, authenticated client.
     
     Returns:
         Google Sheets API service object
     """
-    client = GoogleSheetsClient()
-    client.authenticate()
-    return client.service
+    return get_client().service
 
 
 def read_sheet(sheet_id: str, range_name: str) -> List[List[Any]]:
@@ -212,9 +425,7 @@ def read_sheet(sheet_id: str, range_name: str) -> List[List[Any]]:
     Returns:
         List of rows from the sheet
     """
-    client = GoogleSheetsClient()
-    client.authenticate()
-    return client.read_sheet(sheet_id, range_name)
+    return get_client().read_sheet(sheet_id, range_name)
 
 
 if __name__ == "__main__":
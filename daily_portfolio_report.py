@@ -8,35 +8,39 @@ This script:
 4. Sends a formatted email report
 
 Usage:
-    poetry run python daily_portfolio_report.py
+    poetry run python daily_portfolio_report.py [--processes N]
 """
 
 import sys
+import argparse
+import asyncio
 import logging
+import multiprocessing as mp
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
-import importlib.util
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple, Union
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
 from dotenv import load_dotenv
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
-# Load environment variables
-load_dotenv()
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-# Import modules directly to avoid package init issues
-def load_module(name: str, path: Path):
-    """Load a Python module from file path."""
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+from EigenLedger.modules import email_sender, google_auth
 
-# Load our custom modules
-base_path = Path(__file__).parent
-google_auth = load_module("google_auth", base_path / "EigenLedger" / "modules" / "google_auth.py")
-email_sender = load_module("email_sender", base_path / "EigenLedger" / "modules" / "email_sender.py")
+# Load environment variables
+load_dotenv()
 
 # Configure logging
 logging.basicConfig(
@@ -45,46 +49,244 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent per-ticker requests to Yahoo
+MAX_PRICE_WORKERS = 16
+
+# Yahoo chart endpoint used for concurrent price requests when aiohttp is installed
+YAHOO_CHART_URL = 'https://query1.finance.yahoo.com/v8/finance/chart/{ticker}'
+YAHOO_USER_AGENT = 'Mozilla/5.0 (compatible; daily-portfolio-report)'
+PRICE_REQUEST_TIMEOUT = 30
+
+# Keep in-flight chart requests below Yahoo's per-IP throttling threshold and
+# back off exponentially when it answers 429/503 anyway
+MAX_CHART_REQUESTS = 8
+PRICE_RETRY_ATTEMPTS = 3
+RETRY_STATUSES = (429, 503)
+
+# Closes fetched earlier the same day are reused from here
+PRICE_CACHE_PATH = Path('config/price_cache.csv')
+PRICE_CACHE_DAYS = 7
+
+# Columns of the holdings DataFrame in the metrics passed to the email
+HOLDINGS_COLUMNS = ['ticker', 'quantity', 'price', 'value', 'pct_change']
+
+
+# Per-holding values and their total. Compiled with Numba when it is
+# installed; otherwise the same result comes from NumPy array operations.
+if njit is not None:
+    @njit(cache=True)
+    def _portfolio_values(prices: np.ndarray, quantities: np.ndarray) -> Tuple[np.ndarray, float]:
+        n = prices.shape[0]
+        values = np.empty(n)
+        total = 0.0
+        for i in range(n):
+            value = prices[i] * quantities[i]
+            values[i] = value
+            total += value
+        return values, total
+else:
+    def _portfolio_values(prices: np.ndarray, quantities: np.ndarray) -> Tuple[np.ndarray, float]:
+        values = prices * quantities
+        return values, values.sum()
+
+
+def _event_loop_running() -> bool:
+    """Return True when called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+async def _fetch_chart_close(
+    session: "aiohttp.ClientSession",
+    ticker: str,
+    limit: asyncio.Semaphore
+) -> Optional[float]:
+    """
+    Fetch the latest close for a ticker from Yahoo's chart endpoint.
+    
+    Throttled responses (429/503) are retried with exponential backoff
+    while still holding the semaphore slot, so the whole batch slows down
+    instead of piling more requests onto a rate-limited connection.
+    
+    Args:
+        session: Open aiohttp session
+        ticker: Stock ticker symbol
+        limit: Semaphore capping concurrent requests
+    
+    Returns:
+        Latest close, or None if the chart has no close for the day
+    
+    Raises:
+        aiohttp.ClientResponseError: If the request fails or is still
+            throttled after PRICE_RETRY_ATTEMPTS attempts
+    """
+    url = YAHOO_CHART_URL.format(ticker=quote(ticker, safe=''))
+    async with limit:
+        for attempt in range(PRICE_RETRY_ATTEMPTS):
+            try:
+                async with session.get(url, params={'range': '1d', 'interval': '1d'}) as response:
+                    response.raise_for_status()
+                    payload = await response.json()
+                break
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUSES or attempt == PRICE_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = 2 ** attempt
+                logger.debug("Yahoo returned %s for %s, retrying in %ss", e.status, ticker, delay)
+                await asyncio.sleep(delay)
+    
+    results = (payload.get('chart') or {}).get('result') or []
+    if not results:
+        return None
+    closes = results[0]['indicators']['quote'][0].get('close') or []
+    closes = [close for close in closes if close is not None]
+    return float(closes[-1]) if closes else None
+
+
+async def _fetch_chart_prices(tickers: List[str]) -> Tuple[Dict[str, float], List[str]]:
+    """
+    Fetch latest closes for all tickers concurrently on one event loop.
+    
+    Args:
+        tickers: List of stock ticker symbols
+    
+    Returns:
+        Tuple of (dictionary mapping ticker to price for tickers that had
+        data, tickers still throttled after PRICE_RETRY_ATTEMPTS attempts)
+    """
+    timeout = aiohttp.ClientTimeout(total=PRICE_REQUEST_TIMEOUT)
+    headers = {'User-Agent': YAHOO_USER_AGENT}
+    limit = asyncio.Semaphore(MAX_CHART_REQUESTS)
+    async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+        results = await asyncio.gather(
+            *(_fetch_chart_close(session, ticker, limit) for ticker in tickers),
+            return_exceptions=True
+        )
+    
+    prices = {}
+    throttled = []
+    for ticker, result in zip(tickers, results):
+        if isinstance(result, aiohttp.ClientResponseError) and result.status in RETRY_STATUSES:
+            logger.warning(f"Rate limited by Yahoo for {ticker} after {PRICE_RETRY_ATTEMPTS} attempts")
+            throttled.append(ticker)
+        elif isinstance(result, Exception):
+            logger.debug("Chart request for %s failed: %s", ticker, result)
+        elif result is not None:
+            prices[ticker] = result
+            logger.debug("%s: $%.2f", ticker, result)
+    
+    return prices, throttled
+
+
+def _last_close(data: pd.DataFrame, ticker: str) -> Optional[float]:
+    """
+    Get the latest close for a ticker from a batched yfinance download.
+    
+    Args:
+        data: Result of ``yf.download(..., group_by='ticker')``
+        ticker: Stock ticker symbol
+    
+    Returns:
+        Last non-NaN close, or None if the ticker has no price data
+    """
+    if isinstance(data.columns, pd.MultiIndex):
+        if ticker not in data.columns.get_level_values(0):
+            return None
+        closes = data[ticker]['Close']
+    elif 'Close' in data.columns:
+        # Older yfinance returns flat columns for a single ticker
+        closes = data['Close']
+    else:
+        return None
+    
+    closes = closes.dropna()
+    return float(closes.iloc[-1]) if not closes.empty else None
+
+
+def _fetch_one(ticker: str) -> Optional[float]:
+    """
+    Fetch the latest close for a single ticker.
+    
+    Args:
+        ticker: Stock ticker symbol
+    
+    Returns:
+        Latest close, or None if Yahoo returned no history
+    """
+    # Only the raw close is needed: skip the dividend/split columns and the
+    # price adjustment pass (which also keeps this consistent with the
+    # unadjusted batch download)
+    hist = yf.Ticker(ticker).history(period='1d', auto_adjust=False, actions=False)
+    if hist.empty:
+        return None
+    
+    closes = hist['Close'].dropna()
+    return float(closes.iloc[-1]) if not closes.empty else None
+
 
 class PortfolioDataManager:
     """
     Manages portfolio data fetching and processing.
     """
     
-    def __init__(self, sheet_id: str, sheet_range: str):
+    def __init__(self, sheet_id: str, sheet_range: Union[str, List[str]],
+                 price_cache_path: Path = PRICE_CACHE_PATH, processes: int = 0):
         """
         Initialize the portfolio data manager.
         
         Args:
             sheet_id: Google Sheet ID
-            sheet_range: Sheet range (e.g., 'Sheet1!A1:Z100')
+            sheet_range: Sheet range (e.g., 'Sheet1!A1:Z100'), or a list of
+                ranges (e.g., one per account tab) that are read together
+            price_cache_path: CSV file caching closes by (ticker, date)
+            processes: Fetch prices in a pool of this many worker processes
+                (0 or 1 keeps fetching in this process)
         """
         self.sheet_id = sheet_id
-        self.sheet_range = sheet_range
-        self.sheets_client = google_auth.GoogleSheetsClient()
+        self.sheet_ranges = [sheet_range] if isinstance(sheet_range, str) else list(sheet_range)
+        self.sheets_client = google_auth.get_client()
+        self.price_cache_path = Path(price_cache_path)
+        self.processes = processes
+        self._price_cache: Optional[Dict[Tuple[str, str], float]] = None
     
     def fetch_holdings(self) -> pd.DataFrame:
         """
         Fetch portfolio holdings from Google Sheets.
         
+        All ranges are read in a single batchGet request. Each range must
+        start with its own header row; the rows are concatenated.
+        Quantity is float64 and Stock is categorical.
+        
         Returns:
             DataFrame with columns: Company, Account, Stock, Quantity, Purchase date
         """
         logger.info(f"Fetching holdings from Google Sheets")
         
-        # Authenticate if needed
-        self.sheets_client.authenticate()
+        # Read data column by column straight into typed columns; numbers
+        # come back as JSON numbers rather than formatted strings
+        results = self.sheets_client.read_sheets_df(
+            self.sheet_id,
+            self.sheet_ranges,
+            dtypes={'Quantity': 'float64', 'Stock': 'string'}
+        )
         
-        # Read data
-        data = self.sheets_client.read_sheet(self.sheet_id, self.sheet_range)
+        frames = []
+        for range_name, frame in zip(self.sheet_ranges, results):
+            if frame.columns.empty:
+                logger.warning(f"No data found in range {range_name}")
+                continue
+            frames.append(frame)
         
-        if not data:
+        if not frames:
             raise ValueError("No data found in Google Sheet")
         
-        # Convert to DataFrame
-        headers = data[0]
-        rows = data[1:]
-        df = pd.DataFrame(rows, columns=headers)
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        # Repeated tickers (one row per lot/account) collapse to integer
+        # codes, which groupby uses directly instead of hashing strings
+        df['Stock'] = df['Stock'].astype('category')
         
         logger.info(f"Fetched {len(df)} holdings from Google Sheets")
         return df
@@ -93,6 +295,9 @@ class PortfolioDataManager:
         """
         Fetch current prices for tickers using yfinance.
         
+        Closes already fetched today (UTC) are served from the price cache;
+        only the remaining tickers go to the network.
+        
         Args:
             tickers: List of stock ticker symbols
         
@@ -101,20 +306,214 @@ class PortfolioDataManager:
         """
         logger.info(f"Fetching current prices for {len(tickers)} tickers")
         prices = {}
+        if not tickers:
+            return prices
+        
+        today = datetime.now(timezone.utc).date().isoformat()
+        cache = self._load_price_cache()
         
+        misses = []
         for ticker in tickers:
+            cached = cache.get((ticker, today))
+            if cached is not None:
+                prices[ticker] = cached
+            else:
+                misses.append(ticker)
+        
+        if len(misses) < len(tickers):
+            logger.info(f"Using cached prices for {len(tickers) - len(misses)} tickers")
+        if not misses:
+            return prices
+        
+        fetched = self._download_prices(misses)
+        prices.update(fetched)
+        
+        # Failed lookups come back as 0.0 and are retried on the next run
+        new_entries = {(ticker, today): price for ticker, price in fetched.items() if price}
+        if new_entries:
+            cache.update(new_entries)
+            self._save_price_cache()
+        
+        return prices
+    
+    def _download_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Fetch current prices from Yahoo Finance.
+        
+        With aiohttp installed, every ticker's chart is requested concurrently
+        on one event loop; otherwise all tickers go through one batched
+        ``yf.download`` call. Tickers either path misses are retried one by
+        one, except those Yahoo is still throttling: retrying them outside
+        the MAX_CHART_REQUESTS cap would only add load, so they are left
+        unpriced until the next run. With ``processes`` set, every ticker
+        is already fetched on its own in a process pool, so there is no
+        retry.
+        
+        Args:
+            tickers: List of stock ticker symbols
+        
+        Returns:
+            Dictionary mapping ticker to current price
+        """
+        if self.processes > 1:
+            return self._fetch_prices_in_processes(tickers)
+        
+        throttled = []
+        if aiohttp is not None and not _event_loop_running():
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period='1d')
-                if not hist.empty:
-                    prices[ticker] = hist['Close'].iloc[-1]
-                    logger.debug(f"{ticker}: ${prices[ticker]:.2f}")
+                prices, throttled = asyncio.run(_fetch_chart_prices(tickers))
+            except Exception as e:
+                logger.error(f"Error fetching prices: {e}")
+                prices = {}
+        else:
+            prices = self._download_batch(tickers)
+        
+        if throttled:
+            logger.warning(f"Leaving {len(throttled)} throttled tickers unpriced until the next run")
+        
+        skip = set(prices).union(throttled)
+        missing = [ticker for ticker in tickers if ticker not in skip]
+        if missing:
+            # Retry the gaps one symbol at a time so a bad ticker is isolated
+            # and logged on its own
+            prices.update(self._fetch_prices_individually(missing))
+        
+        return prices
+    
+    def _download_batch(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Fetch prices with a single batched ``yf.download`` call.
+        
+        Args:
+            tickers: List of stock ticker symbols
+        
+        Returns:
+            Dictionary mapping ticker to price, for tickers that had data
+        """
+        prices = {}
+        
+        try:
+            data = yf.download(
+                list(tickers),
+                period='1d',
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                auto_adjust=False
+            )
+        except Exception as e:
+            logger.error(f"Error fetching prices: {e}")
+            return prices
+        
+        for ticker in tickers:
+            price = _last_close(data, ticker)
+            if price is not None:
+                prices[ticker] = price
+                logger.debug("%s: $%.2f", ticker, prices[ticker])
+        
+        return prices
+    
+    def _load_price_cache(self) -> Dict[Tuple[str, str], float]:
+        """
+        Load the on-disk price cache into memory (once per manager).
+        
+        Returns:
+            Dictionary mapping (ticker, ISO date) to close price
+        """
+        if self._price_cache is not None:
+            return self._price_cache
+        
+        self._price_cache = {}
+        try:
+            df = pd.read_csv(self.price_cache_path, dtype={'ticker': str, 'date': str})
+            self._price_cache = {
+                (ticker, date): float(close)
+                for ticker, date, close in zip(df['ticker'], df['date'], df['close'])
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable price cache {self.price_cache_path}: {e}")
+        
+        return self._price_cache
+    
+    def _save_price_cache(self) -> None:
+        """Write the price cache to disk, dropping entries past PRICE_CACHE_DAYS."""
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=PRICE_CACHE_DAYS)).isoformat()
+        self._price_cache = {
+            key: close for key, close in self._price_cache.items() if key[1] > cutoff
+        }
+        
+        df = pd.DataFrame(
+            [(ticker, date, close) for (ticker, date), close in self._price_cache.items()],
+            columns=['ticker', 'date', 'close']
+        )
+        try:
+            self.price_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_csv(self.price_cache_path, index=False)
+        except OSError as e:
+            logger.warning(f"Could not write price cache {self.price_cache_path}: {e}")
+    
+    def _fetch_prices_in_processes(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Fetch prices one ticker per task, spread over a pool of processes.
+        
+        Args:
+            tickers: List of stock ticker symbols
+        
+        Returns:
+            Dictionary mapping ticker to current price (0.0 when unavailable)
+        """
+        processes = min(self.processes, len(tickers))
+        logger.info(f"Fetching {len(tickers)} tickers across {processes} processes")
+        prices = {ticker: 0.0 for ticker in tickers}
+        
+        with mp.Pool(processes) as pool:
+            pending = [(ticker, pool.apply_async(_fetch_one, (ticker,))) for ticker in tickers]
+            for ticker, result in pending:
+                try:
+                    price = result.get()
+                except Exception as e:
+                    logger.error(f"Error fetching price for {ticker}: {e}")
+                    continue
+                
+                if price is not None:
+                    prices[ticker] = price
+                    logger.debug("%s: $%.2f", ticker, price)
+                else:
+                    logger.warning(f"No price data for {ticker}")
+        
+        return prices
+    
+    def _fetch_prices_individually(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Fetch prices one ticker per request, running the requests concurrently.
+        
+        Args:
+            tickers: List of stock ticker symbols
+        
+        Returns:
+            Dictionary mapping ticker to current price (0.0 when unavailable)
+        """
+        logger.info(f"Fetching {len(tickers)} tickers individually")
+        prices = {ticker: 0.0 for ticker in tickers}
+        
+        workers = min(MAX_PRICE_WORKERS, len(tickers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_fetch_one, ticker): ticker for ticker in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    price = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching price for {ticker}: {e}")
+                    continue
+                
+                if price is not None:
+                    prices[ticker] = price
+                    logger.debug("%s: $%.2f", ticker, price)
                 else:
                     logger.warning(f"No price data for {ticker}")
-                    prices[ticker] = 0.0
-            except Exception as e:
-                logger.error(f"Error fetching price for {ticker}: {e}")
-                prices[ticker] = 0.0
         
         return prices
     
@@ -126,60 +525,98 @@ class PortfolioDataManager:
             holdings_df: DataFrame with holdings information
         
         Returns:
-            Dictionary with portfolio metrics
+            Dictionary with portfolio metrics; 'holdings' is a DataFrame with
+            HOLDINGS_COLUMNS sorted by value, and 'unpriced' lists the tickers
+            with no current price (NaN price and value, left out of
+            'total_value')
         """
         logger.info("Calculating portfolio metrics")
         
+        if holdings_df.empty:
+            # Nothing to value: skip the groupby and the price lookup
+            logger.info("No holdings to value")
+            return self._build_metrics(pd.DataFrame(columns=HOLDINGS_COLUMNS), 0.0)
+        
         # Get unique tickers and quantities
-        portfolio_summary = holdings_df.groupby('Stock').agg({
-            'Quantity': lambda x: pd.to_numeric(x, errors='coerce').sum()
-        }).reset_index()
+        holdings_df = holdings_df.assign(
+            Quantity=pd.to_numeric(holdings_df['Quantity'], errors='coerce')
+        )
+        portfolio_summary = holdings_df.groupby(
+            'Stock', sort=False, observed=True, as_index=False
+        )['Quantity'].sum()
+        portfolio_summary['Stock'] = portfolio_summary['Stock'].astype(str)
         
         tickers = portfolio_summary['Stock'].tolist()
-        quantities = portfolio_summary['Quantity'].tolist()
         
         # Fetch current prices
         current_prices = self.fetch_current_prices(tickers)
         
         # Calculate values
-        holdings_data = []
-        total_value = 0.0
-        
-        for ticker, qty in zip(tickers, quantities):
-            price = current_prices.get(ticker, 0.0)
-            value = price * qty
-            total_value += value
-            
-            holdings_data.append({
-                'ticker': ticker,
-                'quantity': qty,
-                'price': price,
-                'value': value,
-                'pct_change': 0.0  # Would need historical data for this
-            })
+        summary = portfolio_summary.rename(columns={'Stock': 'ticker', 'Quantity': 'quantity'})
+        prices = summary['ticker'].map(current_prices).to_numpy(dtype=np.float64, na_value=np.nan)
+        quantities = summary['quantity'].to_numpy(dtype=np.float64, na_value=0.0)
+        # Failed lookups come back missing or as 0.0; value them as unknown,
+        # not as worthless
+        priced = prices > 0
+        values, total_value = _portfolio_values(np.where(priced, prices, 0.0), quantities)
+        total_value = float(total_value)
+        summary['price'] = np.where(priced, prices, np.nan)
+        summary['value'] = np.where(priced, values, np.nan)
+        summary['pct_change'] = 0.0  # Would need historical data for this
         
         # Sort by value descending
-        holdings_data.sort(key=lambda x: x['value'], reverse=True)
+        summary = summary.sort_values('value', ascending=False, kind='stable', ignore_index=True)
+        
+        metrics = self._build_metrics(summary, total_value)
+        
+        logger.info(f"Portfolio value: ${total_value:,.2f}")
+        logger.info(f"Number of holdings: {len(summary)}")
+        if metrics['unpriced']:
+            logger.warning(f"No current price for {', '.join(metrics['unpriced'])}; excluded from the total")
         
-        metrics = {
+        return metrics
+    
+    def _build_metrics(self, summary: pd.DataFrame, total_value: float) -> Dict[str, Any]:
+        """
+        Assemble the metrics dictionary from the valued holdings.
+        
+        Args:
+            summary: Holdings with HOLDINGS_COLUMNS, sorted by value (NaN
+                value for holdings without a price)
+            total_value: Sum of the priced holding values
+        
+        Returns:
+            Dictionary with portfolio metrics
+        """
+        return {
             'total_value': total_value,
             'daily_change': 0.0,  # Would need previous day's data
             'daily_change_pct': 0.0,
             'total_return': 0.0,  # Would need cost basis
             'total_return_pct': 0.0,
-            'holdings': holdings_data,
-            'num_holdings': len(holdings_data),
-            'largest_holding': holdings_data[0]['ticker'] if holdings_data else 'N/A',
+            'holdings': summary,
+            'num_holdings': len(summary),
+            'largest_holding': summary['ticker'].iat[0] if len(summary) else 'N/A',
+            'unpriced': summary.loc[summary['value'].isna(), 'ticker'].tolist(),
         }
-        
-        logger.info(f"Portfolio value: ${total_value:,.2f}")
-        logger.info(f"Number of holdings: {len(holdings_data)}")
-        
-        return metrics
 
 
-def main():
-    """Main execution function."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main execution function.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Send the daily portfolio report email.")
+    parser.add_argument(
+        '--processes', type=int, default=0, metavar='N',
+        help="fetch prices in N worker processes (for very large portfolios)"
+    )
+    args = parser.parse_args(argv)
     
     print("=" * 60)
     print("📊 Daily Portfolio Report")
@@ -227,7 +664,9 @@ def main():
     try:
         # Step 1: Fetch portfolio data
         print("📥 Step 1: Fetching portfolio holdings from Google Sheets...")
-        manager = PortfolioDataManager(sheet_id, sheet_range)
+        # Several ranges (e.g. one per account tab) may be separated by ';'
+        sheet_ranges = [r.strip() for r in sheet_range.split(';') if r.strip()]
+        manager = PortfolioDataManager(sheet_id, sheet_ranges, processes=args.processes)
         holdings_df = manager.fetch_holdings()
         print(f"   ✅ Fetched {len(holdings_df)} holdings")
         print()
@@ -238,17 +677,20 @@ def main():
         print(f"   ✅ Portfolio value: ${metrics['total_value']:,.2f}")
         print(f"   ✅ Number of holdings: {metrics['num_holdings']}")
         print(f"   ✅ Largest holding: {metrics['largest_holding']}")
+        if metrics['unpriced']:
+            print(f"   ⚠️  No price for {len(metrics['unpriced'])} holdings: {', '.join(metrics['unpriced'])}")
         print()
         
         # Step 3: Send email
         print("📧 Step 3: Sending email report...")
+        # One message: send without a with block so connection and login
+        # failures are reported through send_email's False return
         sender = email_sender.EmailSender(
             smtp_server=smtp_server,
             smtp_port=smtp_port,
             from_email=email_from,
             password=email_password
         )
-        
         success = sender.send_portfolio_summary([email_to], metrics)
         
         if success:
@@ -275,4 +717,8 @@ def main():
 
 
 if __name__ == "__main__":
+    if njit is not None:
+        # Load the compiled kernel from Numba's cache (or compile it) now,
+        # not in the middle of Step 2
+        _portfolio_values(np.zeros(1), np.zeros(1))
     sys.exit(main())
@@ -9,22 +9,14 @@ Usage:
 
 import sys
 import logging
-from pathlib import Path
-import importlib.util
 import os
 from dotenv import load_dotenv
 
+from EigenLedger.modules import email_sender
+
 # Load environment variables
 load_dotenv()
 
-# Import email_sender module directly
-spec = importlib.util.spec_from_file_location(
-    "email_sender",
-    Path(__file__).parent / "EigenLedger" / "modules" / "email_sender.py"
-)
-email_sender = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(email_sender)
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -12,19 +12,11 @@ Usage:
 import sys
 import logging
 from pathlib import Path
-import importlib.util
 
 # Add EigenLedger to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Import directly from google_auth module file to avoid package __init__.py
-spec = importlib.util.spec_from_file_location(
-    "google_auth",
-    Path(__file__).parent / "EigenLedger" / "modules" / "google_auth.py"
-)
-google_auth = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(google_auth)
-GoogleSheetsClient = google_auth.GoogleSheetsClient
+from EigenLedger.modules.google_auth import GoogleSheetsClient
 
 # Configure logging
 logging.basicConfig(
@@ -69,7 +61,7 @@ def main():
         print()
         
         # Show token status
-        token_path = Path('config/token.pickle')
+        token_path = client.token_path
         if token_path.exists():
             print(f"✅ Token saved to: {token_path}")
             print("   (Future runs will use this token automatically)")
@@ -0,0 +1,131 @@
+"""
+Unit tests for the streaming SMTP send path of the email sender module.
+
+Usage:
+    poetry run python -m unittest discover tests
+"""
+
+import io
+import re
+import smtplib
+import socketserver
+import threading
+import unittest
+from typing import List
+
+from EigenLedger.modules import email_sender
+from EigenLedger.modules.email_sender import _DotStuffingWriter
+
+
+def _stuffed(data: bytes) -> bytes:
+    """Reference dot-stuffing of a whole CRLF message, as smtplib does it."""
+    return re.sub(rb'(?m)^\.', b'..', data)
+
+
+def _write_chunks(chunks: List[bytes]) -> bytes:
+    raw = io.BytesIO()
+    writer = _DotStuffingWriter(raw)
+    for chunk in chunks:
+        writer.write(chunk)
+    writer.finish()
+    return raw.getvalue()
+
+
+class DotStuffingWriterTest(unittest.TestCase):
+
+    def test_leading_dots_are_doubled(self):
+        data = b'.first\r\nplain\r\n..two\r\n.\r\nlast.\r\n'
+        self.assertEqual(
+            _write_chunks([data]),
+            b'..first\r\nplain\r\n...two\r\n..\r\nlast.\r\n.\r\n'
+        )
+    
+    def test_writes_split_across_line_breaks(self):
+        data = b'a\r\n.b\r\n.\r\nc.d\r\n..e\r\n'
+        expected = _stuffed(data) + b'.\r\n'
+        # Every way of cutting the stream into two or three writes
+        for i in range(len(data) + 1):
+            for j in range(i, len(data) + 1):
+                with self.subTest(split=(i, j)):
+                    chunks = [data[:i], data[i:j], data[j:]]
+                    self.assertEqual(_write_chunks(chunks), expected)
+    
+    def test_single_byte_writes(self):
+        data = b'.x\r\ny\r\n.\r\n.z'
+        chunks = [data[i:i + 1] for i in range(len(data))]
+        self.assertEqual(_write_chunks(chunks), _stuffed(data) + b'\r\n.\r\n')
+    
+    def test_finish_terminates_last_line(self):
+        self.assertEqual(_write_chunks([b'no newline']), b'no newline\r\n.\r\n')
+        self.assertEqual(_write_chunks([b'newline\r\n']), b'newline\r\n.\r\n')
+        self.assertEqual(_write_chunks([]), b'.\r\n')
+
+
+class _StubSMTPHandler(socketserver.StreamRequestHandler):
+    """Accepts one SMTP session and records the un-stuffed DATA payloads."""
+    
+    def _reply(self, line: bytes) -> None:
+        self.wfile.write(line + b'\r\n')
+        self.wfile.flush()
+    
+    def handle(self) -> None:
+        self._reply(b'220 stub ESMTP')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.strip().upper()
+            if command.startswith((b'EHLO', b'HELO')):
+                self._reply(b'250 stub')
+            elif command.startswith((b'MAIL', b'RCPT', b'RSET', b'NOOP')):
+                self._reply(b'250 ok')
+            elif command == b'DATA':
+                self._reply(b'354 go ahead')
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if line in (b'.\r\n', b''):
+                        break
+                    lines.append(line[1:] if line.startswith(b'.') else line)
+                self.server.messages.append(b''.join(lines))
+                self._reply(b'250 queued')
+            elif command == b'QUIT':
+                self._reply(b'221 bye')
+                return
+            else:
+                self._reply(b'502 not implemented')
+
+
+class StreamingSendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _StubSMTPHandler)
+        self.server.daemon_threads = True
+        self.server.messages = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+    
+    def test_round_trip(self):
+        host, port = self.server.server_address
+        sender = email_sender.EmailSender(host, port, 'from@example.com', 'secret')
+        html = '<p>Totals</p>\n.hidden line\n<p>café – done.</p>\n.'
+        msg = email_sender._build_message(
+            'from@example.com', ['to@example.com'], 'Report', html, None, None
+        )
+        
+        smtp = smtplib.SMTP(host, port)
+        try:
+            sender._send_streaming(smtp, msg, ['to@example.com'])
+        finally:
+            smtp.quit()
+        
+        expected = msg.as_bytes(policy=msg.policy.clone(linesep='\r\n'))
+        if not expected.endswith(b'\r\n'):
+            expected += b'\r\n'
+        self.assertIn(b'\r\n.', expected)  # the body really needs stuffing
+        self.assertEqual(self.server.messages, [expected])
+
+
+if __name__ == '__main__':
+    unittest.main()